@@ -32,6 +32,8 @@
 class Node:
     """ The base class for all other nodes to display the AST of CQL.
     """
+    __slots__ = ()
+
     inline = False
 
     def get_sub_nodes(self):
@@ -56,13 +58,21 @@ class Node:
         if type(self) != type(other):
             return False
 
-        return self.__dict__ == other.__dict__
+        # subclasses without __slots__ keep their own fields in __dict__
+        if getattr(self, '__dict__', None) != getattr(other, '__dict__', None):
+            return False
+
+        return all(
+            getattr(self, name) == getattr(other, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, '__slots__', ())
+        )
 
 
 class ConditionNode(Node):
     """ The base class for all nodes representing a condition
     """
-    pass
+    __slots__ = ()
 
 
 class NotConditionNode(ConditionNode):
@@ -72,6 +82,7 @@ class NotConditionNode(ConditionNode):
     :ivar sub_node: the condition node to be negated
     :type sub_node: Node
     """
+    __slots__ = ('sub_node',)
 
     def __init__(self, sub_node):
         self.sub_node = sub_node
@@ -95,6 +106,8 @@ class CombinationConditionNode(ConditionNode):
         :ivar op: the combination type. Either ``"AND"`` or ``"OR"``
         :type op: str
     """
+    __slots__ = ('lhs', 'rhs', 'op')
+
     def __init__(self, lhs, rhs, op):
         self.lhs = lhs
         self.rhs = rhs
@@ -110,7 +123,7 @@ class CombinationConditionNode(ConditionNode):
 class PredicateNode(Node):
     """ The base class for all nodes representing a predicate
     """
-    pass
+    __slots__ = ()
 
 
 class ComparisonPredicateNode(PredicateNode):
@@ -125,6 +138,8 @@ class ComparisonPredicateNode(PredicateNode):
                   ``">"``, ``"<="``, ``">="``
         :type op: str
     """
+    __slots__ = ('lhs', 'rhs', 'op')
+
     def __init__(self, lhs, rhs, op):
         self.lhs = lhs
         self.rhs = rhs
@@ -150,6 +165,8 @@ class BetweenPredicateNode(PredicateNode):
         :ivar not_: whether the predicate shall be negated
         :type not_: bool
     """
+    __slots__ = ('lhs', 'low', 'high', 'not_')
+
     def __init__(self, lhs, low, high, not_):
         self.lhs = lhs
         self.low = low
@@ -175,6 +192,8 @@ class LikePredicateNode(PredicateNode):
         :ivar not_: whether the predicate shall be negated
         :type not_: bool
     """
+    __slots__ = ('lhs', 'rhs', 'case', 'not_')
+
     def __init__(self, lhs, rhs, case, not_):
         self.lhs = lhs
         self.rhs = rhs
@@ -202,6 +221,8 @@ class InPredicateNode(PredicateNode):
         :ivar not_: whether the predicate shall be negated
         :type not_: bool
     """
+    __slots__ = ('lhs', 'sub_nodes', 'not_')
+
     def __init__(self, lhs, sub_nodes, not_):
         self.lhs = lhs
         self.sub_nodes = sub_nodes
@@ -225,6 +246,8 @@ class NullPredicateNode(PredicateNode):
         :ivar not_: whether the predicate shall be negated
         :type not_: bool
     """
+    __slots__ = ('lhs', 'not_')
+
     def __init__(self, lhs, not_):
         self.lhs = lhs
         self.not_ = not_
@@ -252,6 +275,8 @@ class TemporalPredicateNode(PredicateNode):
                   ``"DURING OR AFTER"``, ``"AFTER"``
         :type op: str
     """
+    __slots__ = ('lhs', 'rhs', 'op')
+
     def __init__(self, lhs, rhs, op):
         self.lhs = lhs
         self.rhs = rhs
@@ -283,6 +308,8 @@ class SpatialPredicateNode(PredicateNode):
         :ivar units: the units for distance related operations
         :type units: str or None
     """
+    __slots__ = ('lhs', 'rhs', 'op', 'pattern', 'distance', 'units')
+
     def __init__(self, lhs, rhs, op, pattern=None, distance=None, units=None):
         self.lhs = lhs
         self.rhs = rhs
@@ -320,6 +347,8 @@ class BBoxPredicateNode(PredicateNode):
                    for the CRS the BBox is expressed in
         :type crs: str
     """
+    __slots__ = ('lhs', 'minx', 'miny', 'maxx', 'maxy', 'crs')
+
     def __init__(self, lhs, minx, miny, maxx, maxy, crs=None):
         self.lhs = lhs
         self.minx = minx
@@ -340,7 +369,7 @@ class BBoxPredicateNode(PredicateNode):
 class ExpressionNode(Node):
     """ The base class for all nodes representing expressions
     """
-    pass
+    __slots__ = ()
 
 
 class AttributeExpression(ExpressionNode):
@@ -349,6 +378,8 @@ class AttributeExpression(ExpressionNode):
         :ivar name: the name of the attribute to be accessed
         :type name: str
     """
+    __slots__ = ('name',)
+
     inline = True
 
     def __init__(self, name):
@@ -364,6 +395,8 @@ class LiteralExpression(ExpressionNode):
         :ivar value: the value of the literal
         :type value: str, float, int, datetime, timedelta
     """
+    __slots__ = ('value',)
+
     inline = True
 
     def __init__(self, value):
@@ -384,6 +417,8 @@ class ArithmeticExpressionNode(ExpressionNode):
         :ivar op: the comparison type. One of ``"+"``, ``"-"``, ``"*"``, ``"/"``
         :type op: str
     """
+    __slots__ = ('lhs', 'rhs', 'op')
+
     def __init__(self, lhs, rhs, op):
         self.lhs = lhs
         self.rhs = rhs
@@ -396,6 +431,46 @@ class ArithmeticExpressionNode(ExpressionNode):
         return "%%s %s %%s" % self.op
 
 
+class AdditionExpressionNode(ArithmeticExpressionNode):
+    """ Node class to represent an addition of two sub-expressions. The
+        operator is always ``"+"``.
+    """
+    __slots__ = ()
+
+    def __init__(self, lhs, rhs):
+        ArithmeticExpressionNode.__init__(self, lhs, rhs, "+")
+
+
+class SubtractionExpressionNode(ArithmeticExpressionNode):
+    """ Node class to represent a subtraction of two sub-expressions. The
+        operator is always ``"-"``.
+    """
+    __slots__ = ()
+
+    def __init__(self, lhs, rhs):
+        ArithmeticExpressionNode.__init__(self, lhs, rhs, "-")
+
+
+class MultiplicationExpressionNode(ArithmeticExpressionNode):
+    """ Node class to represent a multiplication of two sub-expressions. The
+        operator is always ``"*"``.
+    """
+    __slots__ = ()
+
+    def __init__(self, lhs, rhs):
+        ArithmeticExpressionNode.__init__(self, lhs, rhs, "*")
+
+
+class DivisionExpressionNode(ArithmeticExpressionNode):
+    """ Node class to represent a division of two sub-expressions. The
+        operator is always ``"/"``.
+    """
+    __slots__ = ()
+
+    def __init__(self, lhs, rhs):
+        ArithmeticExpressionNode.__init__(self, lhs, rhs, "/")
+
+
 def indent(text, amount, ch=' '):
     padding = amount * ch
     return ''.join(padding+line for line in text.splitlines(True))
@@ -25,11 +25,15 @@
 # THE SOFTWARE.
 # ------------------------------------------------------------------------------
 
+import copy
+import functools
 import logging
+import sys
 
 from ply import lex
 from ply.lex import TOKEN
 
+from . import ast
 from . import values
 
 LOGGER = logging.getLogger(__name__)
@@ -44,16 +48,54 @@ class CQLLexer:
         self.bbox_factory = bbox_factory
         self.time_factory = time_factory
         self.duration_factory = duration_factory
+        self.next_token = None
 
     def build(self, **kwargs):
         pass
         # self.lexer.build()
 
-    def input(self, *args):
-        self.lexer.input(*args)
+    def clone(self):
+        """ Create a copy of this lexer with its own input state, sharing the
+            rules and the factories with the original.
+        """
+        lexer = copy.copy(self)
+        lexer.lexer = self.lexer.clone()
+        return lexer
+
+    def input(self, data):
+        self.lexdata = data
+        self.lexer.input(data)
+        self.lexer.lineno = 1
+
+        # CQL expressions are short, so the whole input is tokenized up
+        # front. The parser can then pull the tokens from a C level iterator
+        # instead of calling back into the lexer for each one.
+        self.next_token = functools.partial(next, iter(self.tokenize()), None)
+
+    def tokenize(self):
+        """ Read all tokens from the current input.
+
+            A NOT directly followed by BETWEEN, LIKE, ILIKE or IN is merged
+            into a single token, so that the parser has a fixed production
+            for each negated predicate.
+
+            :return: the list of tokens
+            :rtype: list[ply.lex.LexToken]
+        """
+        tokens = []
+        previous = None
+        for token in iter(self.lexer.token, None):
+            if (previous is not None and previous.type == "NOT"
+                    and token.type in self.negated_map):
+                previous.type = self.negated_map[token.type]
+                continue
+
+            tokens.append(token)
+            previous = token
+        return tokens
 
     def token(self):
-        self.last_token = self.lexer.token()
+        self.last_token = self.next_token()
         return self.last_token
 
     keywords = (
@@ -65,7 +107,14 @@ class CQLLexer:
         "feet", "meters", "statute miles", "nautical miles", "kilometers"
     )
 
-    tokens = keywords + (
+    negated_map = {
+        "BETWEEN": "NOT_BETWEEN",
+        "LIKE": "NOT_LIKE",
+        "ILIKE": "NOT_ILIKE",
+        "IN": "NOT_IN",
+    }
+
+    tokens = keywords + tuple(negated_map.values()) + (
         # Operators
         'PLUS', 'MINUS', 'TIMES', 'DIVIDE',
         'LT', 'LE', 'GT', 'GE', 'EQ', 'NE',
@@ -87,7 +136,11 @@ class CQLLexer:
         'QUOTED',
     )
 
-    keyword_map = dict((keyword, keyword) for keyword in keywords)
+    keyword_map = dict(
+        (keyword, sys.intern(keyword)) for keyword in keywords
+    )
+    # bound once, so that the identifier rule does a single lookup per token
+    get_keyword = keyword_map.get
 
     identifier_pattern = r'[a-zA-Z_$][0-9a-zA-Z_$]*'
 
@@ -166,7 +219,7 @@ class CQLLexer:
 
     @TOKEN(geometry_pattern)
     def t_GEOMETRY(self, t):
-        t.value = self.geometry_factory(t.value)
+        t.value = ast.LiteralExpression(self.geometry_factory(t.value))
         return t
 
     @TOKEN(envelope_pattern)
@@ -175,7 +228,7 @@ class CQLLexer:
             float(number) for number in
             t.value.partition('(')[2].partition(')')[0].split()
         ]
-        t.value = self.bbox_factory(bbox)
+        t.value = ast.LiteralExpression(self.bbox_factory(bbox))
         return t
 
     @TOKEN(r'(feet)|(meters)|(statute miles)|(nautical miles)|(kilometers)')
@@ -194,22 +247,28 @@ class CQLLexer:
 
     @TOKEN(float_pattern)
     def t_FLOAT(self, t):
-        t.value = float(t.value)
+        t.value = ast.LiteralExpression(float(t.value))
         return t
 
     @TOKEN(int_pattern)
     def t_INTEGER(self, t):
-        t.value = int(t.value)
+        t.value = ast.LiteralExpression(int(t.value))
         return t
 
     @TOKEN(quoted_string_pattern)
     def t_QUOTED(self, t):
-        t.value = t.value[1:-1]
+        t.value = ast.LiteralExpression(t.value[1:-1])
         return t
 
     @TOKEN(identifier_pattern)
     def t_ATTRIBUTE(self, t):
-        t.type = self.keyword_map.get(t.value, "ATTRIBUTE")
+        keyword = self.get_keyword(t.value)
+        if keyword is not None:
+            # hand out the interned keyword string instead of the matched
+            # copy, so that comparing against it is an identity check
+            t.type = t.value = keyword
+        else:
+            t.value = ast.AttributeExpression(t.value)
         return t
 
     def t_newline(self, t):
@@ -1,6 +1,6 @@
 # lextab.py. This file automatically created by PLY (version 3.11). Don't edit!
 _tabversion   = '3.10'
-_lextokens    = set(('AFTER', 'AND', 'ATTRIBUTE', 'BBOX', 'BEFORE', 'BETWEEN', 'BEYOND', 'COMMA', 'CONTAINS', 'CROSSES', 'DISJOINT', 'DIVIDE', 'DURATION', 'DURING', 'DWITHIN', 'ENVELOPE', 'EQ', 'EQUALS', 'FLOAT', 'GE', 'GEOMETRY', 'GT', 'ILIKE', 'IN', 'INTEGER', 'INTERSECTS', 'IS', 'LBRACKET', 'LE', 'LIKE', 'LPAREN', 'LT', 'MINUS', 'NE', 'NOT', 'NULL', 'OR', 'OVERLAPS', 'PLUS', 'QUOTED', 'RBRACKET', 'RELATE', 'RPAREN', 'TIME', 'TIMES', 'TOUCHES', 'UNITS', 'WITHIN', 'feet', 'kilometers', 'meters', 'nautical miles', 'statute miles'))
+_lextokens    = set(('AFTER', 'AND', 'ATTRIBUTE', 'BBOX', 'BEFORE', 'BETWEEN', 'BEYOND', 'COMMA', 'CONTAINS', 'CROSSES', 'DISJOINT', 'DIVIDE', 'DURATION', 'DURING', 'DWITHIN', 'ENVELOPE', 'EQ', 'EQUALS', 'FLOAT', 'GE', 'GEOMETRY', 'GT', 'ILIKE', 'IN', 'INTEGER', 'INTERSECTS', 'IS', 'LBRACKET', 'LE', 'LIKE', 'LPAREN', 'LT', 'MINUS', 'NE', 'NOT', 'NOT_BETWEEN', 'NOT_ILIKE', 'NOT_IN', 'NOT_LIKE', 'NULL', 'OR', 'OVERLAPS', 'PLUS', 'QUOTED', 'RBRACKET', 'RELATE', 'RPAREN', 'TIME', 'TIMES', 'TOUCHES', 'UNITS', 'WITHIN', 'feet', 'kilometers', 'meters', 'nautical miles', 'statute miles'))
 _lexreflags   = 64
 _lexliterals  = ''
 _lexstateinfo = {'INITIAL': 'inclusive'}
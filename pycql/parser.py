@@ -25,7 +25,9 @@
 # THE SOFTWARE.
 # ------------------------------------------------------------------------------
 
+import functools
 import logging
+import threading
 
 from ply import yacc
 
@@ -37,6 +39,10 @@ LOGGER = logging.getLogger(__name__)
 
 
 class CQLParser:
+    __slots__ = ('lexer', 'parser', '_local')
+
+    tokens = CQLLexer.tokens
+
     def __init__(self, geometry_factory=values.Geometry, bbox_factory=values.BBox,
                  time_factory=values.Time, duration_factory=values.Duration):
         self.lexer = CQLLexer(
@@ -50,8 +56,11 @@ class CQLParser:
         )
 
         self.lexer.build()
-        self.tokens = self.lexer.tokens
+        self._local = threading.local()
 
+        # yacc inspects all attributes of the module, so the slot has to be
+        # set before the parser is built
+        self.parser = None
         self.parser = yacc.yacc(
             module=self,
             # start='condition_or_empty',
@@ -64,10 +73,16 @@ class CQLParser:
         )
 
     def parse(self, text):
-        self.__query = text
+        # the lexer holds the input state, so each thread uses its own copy
+        try:
+            lexer = self._local.lexer
+        except AttributeError:
+            lexer = self._local.lexer = self.lexer.clone()
+
+        lexer.input(text)
         return self.parser.parse(
-            input=text,
-            lexer=self.lexer
+            lexer=lexer,
+            tokenfunc=lexer.next_token
         )
 
     def restart(self, *args, **kwargs):
@@ -94,83 +109,116 @@ class CQLParser:
 
     def p_condition(self, p):
         """ condition : predicate
-                      | condition AND condition
+        """
+        p[0] = p[1]
+
+    def p_combination_condition(self, p):
+        """ condition : condition AND condition
                       | condition OR condition
-                      | NOT condition
-                      | LPAREN condition RPAREN
-                      | LBRACKET condition RBRACKET
         """
+        p[0] = ast.CombinationConditionNode(p[1], p[3], p[2])
+
+    def p_not_condition(self, p):
+        """ condition : NOT condition
+        """
+        p[0] = ast.NotConditionNode(p[2])
 
-        if len(p) == 2:
-            p[0] = p[1]
-        elif p[2] in ("AND", "OR"):
-            p[0] = ast.CombinationConditionNode(p[1], p[3], p[2])
-        elif p[1] == "NOT":
-            p[0] = ast.NotConditionNode(p[2])
-        elif p[1] in ("(", "["):
-            p[0] = p[2]
+    def p_grouped_condition(self, p):
+        """ condition : LPAREN condition RPAREN
+                      | LBRACKET condition RBRACKET
+        """
+        p[0] = p[2]
 
     def p_predicate(self, p):
+        """ predicate : temporal_predicate
+                      | spatial_predicate
+        """
+        p[0] = p[1]
+
+    def p_comparison_predicate(self, p):
         """ predicate : expression EQ expression
                       | expression NE expression
                       | expression LT expression
                       | expression LE expression
                       | expression GT expression
                       | expression GE expression
-                      | expression NOT BETWEEN expression AND expression
-                      | expression BETWEEN expression AND expression
-                      | expression NOT LIKE QUOTED
-                      | expression LIKE QUOTED
-                      | expression NOT ILIKE QUOTED
-                      | expression ILIKE QUOTED
-                      | expression NOT IN LPAREN expression_list RPAREN
-                      | expression IN LPAREN expression_list RPAREN
-                      | expression IS NOT NULL
-                      | expression IS NULL
-                      | temporal_predicate
-                      | spatial_predicate
         """
-        if len(p) == 2:  # hand over temporal and spatial predicates
-            p[0] = p[1]
+        p[0] = ast.ComparisonPredicateNode(p[1], p[3], p[2])
 
-        elif p[2] in ("=", "<>", "<", "<=", ">", ">="):
-            p[0] = ast.ComparisonPredicateNode(p[1], p[3], p[2])
-        else:
-            not_ = False
-            op = p[2]
-            if op == 'NOT':
-                not_ = True
-                op = p[3]
-
-            if op == "BETWEEN":
-                p[0] = ast.BetweenPredicateNode(
-                    p[1], p[4 if not_ else 3], p[6 if not_ else 5], not_
-                )
-            elif op in ("LIKE", "ILIKE"):
-                p[0] = ast.LikePredicateNode(
-                    p[1], ast.LiteralExpression(p[4 if not_ else 3]),
-                    op == "LIKE", not_
-                )
-            elif op == "IN":
-                p[0] = ast.InPredicateNode(p[1], p[5 if not_ else 4], not_)
-
-            elif op == "IS":
-                p[0] = ast.NullPredicateNode(p[1], p[3] == "NOT")
-
-    def p_temporal_predicate(self, p):
+    def p_between_predicate(self, p):
+        """ predicate : expression BETWEEN expression AND expression
+        """
+        p[0] = ast.BetweenPredicateNode(p[1], p[3], p[5], False)
+
+    def p_not_between_predicate(self, p):
+        """ predicate : expression NOT_BETWEEN expression AND expression
+        """
+        p[0] = ast.BetweenPredicateNode(p[1], p[3], p[5], True)
+
+    def p_like_predicate(self, p):
+        """ predicate : expression LIKE QUOTED
+        """
+        p[0] = ast.LikePredicateNode(p[1], p[3], True, False)
+
+    def p_ilike_predicate(self, p):
+        """ predicate : expression ILIKE QUOTED
+        """
+        p[0] = ast.LikePredicateNode(p[1], p[3], False, False)
+
+    def p_not_like_predicate(self, p):
+        """ predicate : expression NOT_LIKE QUOTED
+        """
+        p[0] = ast.LikePredicateNode(p[1], p[3], True, True)
+
+    def p_not_ilike_predicate(self, p):
+        """ predicate : expression NOT_ILIKE QUOTED
+        """
+        p[0] = ast.LikePredicateNode(p[1], p[3], False, True)
+
+    def p_in_predicate(self, p):
+        """ predicate : expression IN LPAREN expression_list RPAREN
+        """
+        p[0] = ast.InPredicateNode(p[1], p[4], False)
+
+    def p_not_in_predicate(self, p):
+        """ predicate : expression NOT_IN LPAREN expression_list RPAREN
+        """
+        p[0] = ast.InPredicateNode(p[1], p[4], True)
+
+    def p_null_predicate(self, p):
+        """ predicate : expression IS NULL
+        """
+        p[0] = ast.NullPredicateNode(p[1], False)
+
+    def p_not_null_predicate(self, p):
+        """ predicate : expression IS NOT NULL
+        """
+        p[0] = ast.NullPredicateNode(p[1], True)
+
+    def p_before_predicate(self, p):
         """ temporal_predicate : expression BEFORE TIME
-                               | expression BEFORE OR DURING time_period
-                               | expression DURING time_period
-                               | expression DURING OR AFTER time_period
-                               | expression AFTER TIME
         """
+        p[0] = ast.TemporalPredicateNode(p[1], p[3], "BEFORE")
 
-        if len(p) > 4:
-            op = " ".join(p[2:-1])
-        else:
-            op = p[2]
+    def p_before_or_during_predicate(self, p):
+        """ temporal_predicate : expression BEFORE OR DURING time_period
+        """
+        p[0] = ast.TemporalPredicateNode(p[1], p[5], "BEFORE OR DURING")
 
-        p[0] = ast.TemporalPredicateNode(p[1], p[3 if len(p) == 4 else 5], op)
+    def p_during_predicate(self, p):
+        """ temporal_predicate : expression DURING time_period
+        """
+        p[0] = ast.TemporalPredicateNode(p[1], p[3], "DURING")
+
+    def p_during_or_after_predicate(self, p):
+        """ temporal_predicate : expression DURING OR AFTER time_period
+        """
+        p[0] = ast.TemporalPredicateNode(p[1], p[5], "DURING OR AFTER")
+
+    def p_after_predicate(self, p):
+        """ temporal_predicate : expression AFTER TIME
+        """
+        p[0] = ast.TemporalPredicateNode(p[1], p[3], "AFTER")
 
     def p_time_period(self, p):
         """ time_period : TIME DIVIDE TIME
@@ -188,89 +236,111 @@ class CQLParser:
                               | CROSSES LPAREN expression COMMA expression RPAREN
                               | OVERLAPS LPAREN expression COMMA expression RPAREN
                               | EQUALS LPAREN expression COMMA expression RPAREN
-                              | RELATE LPAREN expression COMMA expression COMMA QUOTED RPAREN
-                              | DWITHIN LPAREN expression COMMA expression COMMA number COMMA UNITS RPAREN
+        """
+        p[0] = ast.SpatialPredicateNode(p[3], p[5], p[1])
+
+    def p_relate_predicate(self, p):
+        """ spatial_predicate : RELATE LPAREN expression COMMA expression COMMA QUOTED RPAREN
+        """
+        p[0] = ast.SpatialPredicateNode(p[3], p[5], p[1], pattern=p[7].value)
+
+    def p_distance_predicate(self, p):
+        """ spatial_predicate : DWITHIN LPAREN expression COMMA expression COMMA number COMMA UNITS RPAREN
                               | BEYOND LPAREN expression COMMA expression COMMA number COMMA UNITS RPAREN
-                              | BBOX LPAREN expression COMMA number COMMA number COMMA number COMMA number RPAREN
-                              | BBOX LPAREN expression COMMA number COMMA number COMMA number COMMA number COMMA QUOTED RPAREN
-        """
-        op = p[1]
-        lhs = p[3]
-        rhs = p[5]
-
-        if op == "RELATE":
-            p[0] = ast.SpatialPredicateNode(lhs, rhs, op, pattern=p[7])
-        elif op in ("DWITHIN", "BEYOND"):
-            p[0] = ast.SpatialPredicateNode(
-                lhs, rhs, op, distance=p[7], units=p[9]
-            )
-        elif op == "BBOX":
-            p[0] = ast.BBoxPredicateNode(lhs, *p[5::2])
-        else:
-            p[0] = ast.SpatialPredicateNode(lhs, rhs, op)
+        """
+        p[0] = ast.SpatialPredicateNode(
+            p[3], p[5], p[1], distance=p[7], units=p[9]
+        )
+
+    def p_bbox_predicate(self, p):
+        """ spatial_predicate : BBOX LPAREN expression COMMA number COMMA number COMMA number COMMA number RPAREN
+        """
+        p[0] = ast.BBoxPredicateNode(p[3], p[5], p[7], p[9], p[11])
+
+    def p_bbox_crs_predicate(self, p):
+        """ spatial_predicate : BBOX LPAREN expression COMMA number COMMA number COMMA number COMMA number COMMA QUOTED RPAREN
+        """
+        p[0] = ast.BBoxPredicateNode(
+            p[3], p[5], p[7], p[9], p[11], crs=p[13].value
+        )
 
     def p_expression_list(self, p):
+        """ expression_list : expression
+        """
+        p[0] = [p[1]]
+
+    def p_expression_list_append(self, p):
         """ expression_list : expression_list COMMA expression
-                            | expression
         """
-        if len(p) == 2:
-            p[0] = [p[1]]
-        else:
-            p[1].append(p[3])
-            p[0] = p[1]
+        # the rule is left recursive, so the list is built in place while
+        # the parser stack stays flat regardless of the number of items
+        p[0] = p[1]
+        p[0].append(p[3])
 
     def p_expression(self, p):
-        """ expression : expression PLUS expression
-                       | expression MINUS expression
-                       | expression TIMES expression
-                       | expression DIVIDE expression
-                       | LPAREN expression RPAREN
-                       | LBRACKET expression RBRACKET
+        """ expression : ATTRIBUTE
                        | GEOMETRY
                        | ENVELOPE
-                       | attribute
                        | QUOTED
                        | INTEGER
                        | FLOAT
         """
-        if len(p) == 2:
-            if isinstance(p[1], ast.Node):
-                p[0] = p[1]
-            else:
-                p[0] = ast.LiteralExpression(p[1])
-        else:
-            if p[1] in ("(", "["):
-                p[0] = p[2]
-            else:
-                op = p[2]
-                lhs = p[1]
-                rhs = p[3]
-                p[0] = ast.ArithmeticExpressionNode(lhs, rhs, op)
+        # the lexer already wraps these values in their expression nodes
+        p[0] = p[1]
+
+    def p_addition_expression(self, p):
+        """ expression : expression PLUS expression
+        """
+        p[0] = ast.AdditionExpressionNode(p[1], p[3])
+
+    def p_subtraction_expression(self, p):
+        """ expression : expression MINUS expression
+        """
+        p[0] = ast.SubtractionExpressionNode(p[1], p[3])
+
+    def p_multiplication_expression(self, p):
+        """ expression : expression TIMES expression
+        """
+        p[0] = ast.MultiplicationExpressionNode(p[1], p[3])
+
+    def p_division_expression(self, p):
+        """ expression : expression DIVIDE expression
+        """
+        p[0] = ast.DivisionExpressionNode(p[1], p[3])
+
+    def p_grouped_expression(self, p):
+        """ expression : LPAREN expression RPAREN
+                       | LBRACKET expression RBRACKET
+        """
+        p[0] = p[2]
 
     def p_number(self, p):
         """ number : INTEGER
                    | FLOAT
         """
-        p[0] = ast.LiteralExpression(p[1])
-
-    def p_attribute(self, p):
-        """ attribute : ATTRIBUTE
-        """
-        p[0] = ast.AttributeExpression(p[1])
+        p[0] = p[1]
 
     def p_empty(self, p):
         'empty : '
         p[0] = None
 
     def p_error(self, p):
+        # syntax errors are only reported via debug logging, so don't bother
+        # building the messages when nobody is listening
+        if not LOGGER.isEnabledFor(logging.DEBUG):
+            return
+
         if p:
-            LOGGER.debug(dir(p))
-            LOGGER.debug(f"Syntax error at token {p.type}, {p.value}, {p.lexpos}, {p.lineno}")
+            LOGGER.debug(
+                "Syntax error at token %s, %s, %d, %d",
+                p.type, p.value, p.lexpos, p.lineno
+            )
 
-            LOGGER.debug(self.__query.split('\n'))
-            line = self.__query.split('\n')[p.lineno - 1]
+            query = self._local.lexer.lexdata
+            line = query.split('\n')[p.lineno - 1]
+            column = p.lexpos - (query.rfind('\n', 0, p.lexpos) + 1)
             LOGGER.debug(line)
-            LOGGER.debug((' ' * p.lexpos) + '^')
+            LOGGER.debug((' ' * column) + '^')
 
             # Just discard the token and tell the parser it's okay.
             #p.parser.errok()
@@ -278,29 +348,59 @@ class CQLParser:
             LOGGER.debug("Syntax error at EOF")
 
 
-def parse(cql, geometry_factory=values.Geometry, bbox_factory=values.BBox,
-          time_factory=values.Time, duration_factory=values.Duration):
+def parse(cql, geometry_factory=None, bbox_factory=None, time_factory=None,
+          duration_factory=None):
     """ Parses the passed CQL to its AST interpretation. 
 
         :param cql: the CQL expression string to parse
         :type cql: str
         :param geometry_factory: the geometry parsing function: it shall parse
-                                 the given WKT geometry string the relevant type
+                                 the given WKT geometry string the relevant type.
+                                 Defaults to :class:`~pycql.values.Geometry`.
         :param bbox_factory: the bbox parsing function: it shall parse
                              the given BBox tuple the relevant type.
+                             Defaults to :class:`~pycql.values.BBox`.
         :param time_factory: the timestamp parsing function: it shall parse
                              the given ISO8601 timestamp string tuple the relevant
-                             type.
+                             type. Defaults to :class:`~pycql.values.Time`.
         :param duration_factory: the duration parsing function: it shall parse
                                  the given ISO8601 furation string tuple the relevant
-                                 type.
+                                 type. Defaults to
+                                 :class:`~pycql.values.Duration`.
         :return: the parsed CQL expression as an AST
         :rtype: ~pycql.ast.Node
     """
-    parser = CQLParser(
+    if (geometry_factory is None and bbox_factory is None
+            and time_factory is None and duration_factory is None):
+        return _DEFAULT_PARSER.parse(cql)
+
+    factories = (
+        values.Geometry if geometry_factory is None else geometry_factory,
+        values.BBox if bbox_factory is None else bbox_factory,
+        values.Time if time_factory is None else time_factory,
+        values.Duration if duration_factory is None else duration_factory,
+    )
+    try:
+        parser = _get_parser(*factories)
+    except TypeError:
+        # the cache needs hashable factories, any other callable still works
+        # with a parser of its own
+        parser = CQLParser(*factories)
+    return parser.parse(cql)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_parser(geometry_factory, bbox_factory, time_factory, duration_factory):
+    # the parser tables only depend on the grammar, so parsers for the same
+    # set of factories (e.g. from one of the integrations) can be reused
+    return CQLParser(
         geometry_factory,
         bbox_factory,
         time_factory,
         duration_factory
     )
-    return parser.parse(cql)
+
+
+# building the lexer and the parser tables is far more expensive than the
+# actual parsing, so a parser using the default factories is built only once
+_DEFAULT_PARSER = CQLParser()
@@ -6,9 +6,9 @@ _tabversion = '3.10'
 
 _lr_method = 'LALR'
 
-_lr_signature = 'condition_or_emptyleftEQNEleftGTGELTLEleftPLUSMINUSleftTIMESDIVIDEAFTER AND ATTRIBUTE BBOX BEFORE BETWEEN BEYOND COMMA CONTAINS CROSSES DISJOINT DIVIDE DURATION DURING DWITHIN ENVELOPE EQ EQUALS FLOAT GE GEOMETRY GT ILIKE IN INTEGER INTERSECTS IS LBRACKET LE LIKE LPAREN LT MINUS NE NOT NULL OR OVERLAPS PLUS QUOTED RBRACKET RELATE RPAREN TIME TIMES TOUCHES UNITS WITHIN feet kilometers meters nautical miles statute miles condition_or_empty : condition\n                               | empty\n         condition : predicate\n                      | condition AND condition\n                      | condition OR condition\n                      | NOT condition\n                      | LPAREN condition RPAREN\n                      | LBRACKET condition RBRACKET\n         predicate : expression EQ expression\n                      | expression NE expression\n                      | expression LT expression\n                      | expression LE expression\n                      | expression GT expression\n                      | expression GE expression\n                      | expression NOT BETWEEN expression AND expression\n                      | expression BETWEEN expression AND expression\n                      | expression NOT LIKE QUOTED\n                      | expression LIKE QUOTED\n                      | expression NOT ILIKE QUOTED\n                      | expression ILIKE QUOTED\n                      | expression NOT IN LPAREN expression_list RPAREN\n                      | expression IN LPAREN expression_list RPAREN\n                      | expression IS NOT NULL\n                      | expression IS NULL\n                      | temporal_predicate\n                      | spatial_predicate\n         temporal_predicate : expression BEFORE TIME\n                               | expression BEFORE OR DURING time_period\n                               | expression DURING time_period\n                               | expression DURING OR AFTER time_period\n                               | expression AFTER TIME\n         time_period : TIME DIVIDE TIME\n                        | TIME DIVIDE DURATION\n                        | DURATION DIVIDE TIME\n         spatial_predicate : INTERSECTS LPAREN expression COMMA expression RPAREN\n                              | DISJOINT LPAREN expression COMMA expression RPAREN\n                              | CONTAINS LPAREN expression COMMA expression RPAREN\n                              | WITHIN LPAREN expression COMMA expression RPAREN\n                              | TOUCHES LPAREN expression COMMA expression RPAREN\n                              | CROSSES LPAREN expression COMMA expression RPAREN\n                              | OVERLAPS LPAREN expression COMMA expression RPAREN\n                              | EQUALS LPAREN expression COMMA expression RPAREN\n                              | RELATE LPAREN expression COMMA expression COMMA QUOTED RPAREN\n                              | DWITHIN LPAREN expression COMMA expression COMMA number COMMA UNITS RPAREN\n                              | BEYOND LPAREN expression COMMA expression COMMA number COMMA UNITS RPAREN\n                              | BBOX LPAREN expression COMMA number COMMA number COMMA number COMMA number RPAREN\n                              | BBOX LPAREN expression COMMA number COMMA number COMMA number COMMA number COMMA QUOTED RPAREN\n         expression_list : expression_list COMMA expression\n                            | expression\n         expression : expression PLUS expression\n                       | expression MINUS expression\n                       | expression TIMES expression\n                       | expression DIVIDE expression\n                       | LPAREN expression RPAREN\n                       | LBRACKET expression RBRACKET\n                       | GEOMETRY\n                       | ENVELOPE\n                       | attribute\n                       | QUOTED\n                       | INTEGER\n                       | FLOAT\n         number : INTEGER\n                   | FLOAT\n         attribute : ATTRIBUTE\n        empty : '
+_lr_signature = 'condition_or_emptyleftEQNEleftGTGELTLEleftPLUSMINUSleftTIMESDIVIDEAFTER AND ATTRIBUTE BBOX BEFORE BETWEEN BEYOND COMMA CONTAINS CROSSES DISJOINT DIVIDE DURATION DURING DWITHIN ENVELOPE EQ EQUALS FLOAT GE GEOMETRY GT ILIKE IN INTEGER INTERSECTS IS LBRACKET LE LIKE LPAREN LT MINUS NE NOT NOT_BETWEEN NOT_ILIKE NOT_IN NOT_LIKE NULL OR OVERLAPS PLUS QUOTED RBRACKET RELATE RPAREN TIME TIMES TOUCHES UNITS WITHIN feet kilometers meters nautical miles statute miles condition_or_empty : condition\n                               | empty\n         condition : predicate\n         condition : condition AND condition\n                      | condition OR condition\n         condition : NOT condition\n         condition : LPAREN condition RPAREN\n                      | LBRACKET condition RBRACKET\n         predicate : temporal_predicate\n                      | spatial_predicate\n         predicate : expression EQ expression\n                      | expression NE expression\n                      | expression LT expression\n                      | expression LE expression\n                      | expression GT expression\n                      | expression GE expression\n         predicate : expression BETWEEN expression AND expression\n         predicate : expression NOT_BETWEEN expression AND expression\n         predicate : expression LIKE QUOTED\n         predicate : expression ILIKE QUOTED\n         predicate : expression NOT_LIKE QUOTED\n         predicate : expression NOT_ILIKE QUOTED\n         predicate : expression IN LPAREN expression_list RPAREN\n         predicate : expression NOT_IN LPAREN expression_list RPAREN\n         predicate : expression IS NULL\n         predicate : expression IS NOT NULL\n         temporal_predicate : expression BEFORE TIME\n         temporal_predicate : expression BEFORE OR DURING time_period\n         temporal_predicate : expression DURING time_period\n         temporal_predicate : expression DURING OR AFTER time_period\n         temporal_predicate : expression AFTER TIME\n         time_period : TIME DIVIDE TIME\n                        | TIME DIVIDE DURATION\n                        | DURATION DIVIDE TIME\n         spatial_predicate : INTERSECTS LPAREN expression COMMA expression RPAREN\n                              | DISJOINT LPAREN expression COMMA expression RPAREN\n                              | CONTAINS LPAREN expression COMMA expression RPAREN\n                              | WITHIN LPAREN expression COMMA expression RPAREN\n                              | TOUCHES LPAREN expression COMMA expression RPAREN\n                              | CROSSES LPAREN expression COMMA expression RPAREN\n                              | OVERLAPS LPAREN expression COMMA expression RPAREN\n                              | EQUALS LPAREN expression COMMA expression RPAREN\n         spatial_predicate : RELATE LPAREN expression COMMA expression COMMA QUOTED RPAREN\n         spatial_predicate : DWITHIN LPAREN expression COMMA expression COMMA number COMMA UNITS RPAREN\n                              | BEYOND LPAREN expression COMMA expression COMMA number COMMA UNITS RPAREN\n         spatial_predicate : BBOX LPAREN expression COMMA number COMMA number COMMA number COMMA number RPAREN\n         spatial_predicate : BBOX LPAREN expression COMMA number COMMA number COMMA number COMMA number COMMA QUOTED RPAREN\n         expression_list : expression\n         expression_list : expression_list COMMA expression\n         expression : ATTRIBUTE\n                       | GEOMETRY\n                       | ENVELOPE\n                       | QUOTED\n                       | INTEGER\n                       | FLOAT\n         expression : expression PLUS expression\n         expression : expression MINUS expression\n         expression : expression TIMES expression\n         expression : expression DIVIDE expression\n         expression : LPAREN expression RPAREN\n                       | LBRACKET expression RBRACKET\n         number : INTEGER\n                   | FLOAT\n        empty : '
     
-_lr_action_items = {'NOT':([0,5,6,7,8,9,12,13,14,15,16,29,30,31,34,36,48,71,73,92,93,94,95,],[5,5,5,5,43,-59,-56,-57,-58,-60,-61,-64,5,5,43,43,90,-54,-55,-50,-51,-52,-53,]),'LPAREN':([0,5,6,7,17,18,19,20,21,22,23,24,25,26,27,28,30,31,37,38,39,40,41,42,44,47,49,50,51,52,56,57,58,59,60,61,62,63,64,65,66,67,75,76,82,85,89,120,121,129,130,131,132,133,134,135,136,137,138,139,141,145,],[6,6,6,6,56,57,58,59,60,61,62,63,64,65,66,67,6,6,75,75,75,75,75,75,75,89,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,120,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,75,]),'LBRACKET':([0,5,6,7,30,31,37,38,39,40,41,42,44,49,50,51,52,56,57,58,59,60,61,62,63,64,65,66,67,75,76,82,89,120,121,129,130,131,132,133,134,135,136,137,138,139,141,145,],[7,7,7,7,7,7,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'$end':([0,1,2,3,4,9,10,11,12,13,14,15,16,29,32,68,69,70,71,72,73,74,77,78,79,80,81,87,88,91,92,93,94,95,96,98,102,118,119,124,143,144,146,147,148,149,150,165,166,168,169,170,171,172,173,174,175,184,191,192,196,198,],[-65,0,-1,-2,-3,-59,-25,-26,-56,-57,-58,-60,-61,-64,-6,-4,-5,-7,-54,-8,-55,-9,-10,-11,-12,-13,-14,-18,-20,-24,-50,-51,-52,-53,-27,-29,-31,-17,-19,-23,-16,-22,-28,-30,-32,-33,-34,-15,-21,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,]),'GEOMETRY':([0,5,6,7,30,31,37,38,39,40,41,42,44,49,50,51,52,56,57,58,59,60,61,62,63,64,65,66,67,75,76,82,89,120,121,129,130,131,132,133,134,135,136,137,138,139,141,145,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'ENVELOPE':([0,5,6,7,30,31,37,38,39,40,41,42,44,49,50,51,52,56,57,58,59,60,61,62,63,64,65,66,67,75,76,82,89,120,121,129,130,131,132,133,134,135,136,137,138,139,141,145,],[13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,13,]),'QUOTED':([0,5,6,7,30,31,37,38,39,40,41,42,44,45,46,49,50,51,52,56,57,58,59,60,61,62,63,64,65,66,67,75,76,82,83,84,89,120,121,129,130,131,132,133,134,135,136,137,138,139,141,145,176,195,],[9,9,9,9,9,9,9,9,9,9,9,9,9,87,88,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,118,119,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,9,180,197,]),'INTEGER':([0,5,6,7,30,31,37,38,39,40,41,42,44,49,50,51,52,56,57,58,59,60,61,62,63,64,65,66,67,75,76,82,89,120,121,129,130,131,132,133,134,135,136,137,138,139,140,141,145,177,178,179,187,193,],[15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,15,163,15,15,163,163,163,163,163,]),'FLOAT':([0,5,6,7,30,31,37,38,39,40,41,42,44,49,50,51,52,56,57,58,59,60,61,62,63,64,65,66,67,75,76,82,89,120,121,129,130,131,132,133,134,135,136,137,138,139,140,141,145,177,178,179,187,193,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,16,164,16,16,164,164,164,164,164,]),'INTERSECTS':([0,5,6,7,30,31,],[17,17,17,17,17,17,]),'DISJOINT':([0,5,6,7,30,31,],[18,18,18,18,18,18,]),'CONTAINS':([0,5,6,7,30,31,],[19,19,19,19,19,19,]),'WITHIN':([0,5,6,7,30,31,],[20,20,20,20,20,20,]),'TOUCHES':([0,5,6,7,30,31,],[21,21,21,21,21,21,]),'CROSSES':([0,5,6,7,30,31,],[22,22,22,22,22,22,]),'OVERLAPS':([0,5,6,7,30,31,],[23,23,23,23,23,23,]),'EQUALS':([0,5,6,7,30,31,],[24,24,24,24,24,24,]),'RELATE':([0,5,6,7,30,31,],[25,25,25,25,25,25,]),'DWITHIN':([0,5,6,7,30,31,],[26,26,26,26,26,26,]),'BEYOND':([0,5,6,7,30,31,],[27,27,27,27,27,27,]),'BBOX':([0,5,6,7,30,31,],[28,28,28,28,28,28,]),'ATTRIBUTE':([0,5,6,7,30,31,37,38,39,40,41,42,44,49,50,51,52,56,57,58,59,60,61,62,63,64,65,66,67,75,76,82,89,120,121,129,130,131,132,133,134,135,136,137,138,139,141,145,],[29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,29,]),'AND':([2,4,9,10,11,12,13,14,15,16,29,32,33,35,68,69,70,71,72,73,74,77,78,79,80,81,86,87,88,91,92,93,94,95,96,98,102,117,118,119,124,143,144,146,147,148,149,150,165,166,168,169,170,171,172,173,174,175,184,191,192,196,198,],[30,-3,-59,-25,-26,-56,-57,-58,-60,-61,-64,30,30,30,30,30,-7,-54,-8,-55,-9,-10,-11,-12,-13,-14,121,-18,-20,-24,-50,-51,-52,-53,-27,-29,-31,141,-17,-19,-23,-16,-22,-28,-30,-32,-33,-34,-15,-21,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,]),'OR':([2,4,9,10,11,12,13,14,15,16,29,32,33,35,53,54,68,69,70,71,72,73,74,77,78,79,80,81,87,88,91,92,93,94,95,96,98,102,118,119,124,143,144,146,147,148,149,150,165,166,168,169,170,171,172,173,174,175,184,191,192,196,198,],[31,-3,-59,-25,-26,-56,-57,-58,-60,-61,-64,31,31,31,97,99,31,31,-7,-54,-8,-55,-9,-10,-11,-12,-13,-14,-18,-20,-24,-50,-51,-52,-53,-27,-29,-31,-17,-19,-23,-16,-22,-28,-30,-32,-33,-34,-15,-21,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,]),'RPAREN':([4,9,10,11,12,13,14,15,16,29,32,33,34,68,69,70,71,72,73,74,77,78,79,80,81,87,88,91,92,93,94,95,96,98,102,115,118,119,122,123,124,142,143,144,146,147,148,149,150,151,152,153,154,155,156,157,158,163,164,165,166,167,168,169,170,171,172,173,174,175,180,184,188,189,191,192,194,196,197,198,],[-3,-59,-25,-26,-56,-57,-58,-60,-61,-64,-6,70,71,-4,-5,-7,-54,-8,-55,-9,-10,-11,-12,-13,-14,-18,-20,-24,-50,-51,-52,-53,-27,-29,-31,71,-17,-19,-49,144,-23,166,-16,-22,-28,-30,-32,-33,-34,168,169,170,171,172,173,174,175,-62,-63,-15,-21,-48,-35,-36,-37,-38,-39,-40,-41,-42,184,-43,191,192,-44,-45,196,-46,198,-47,]),'RBRACKET':([4,9,10,11,12,13,14,15,16,29,32,35,36,68,69,70,71,72,73,74,77,78,79,80,81,87,88,91,92,93,94,95,96,98,102,116,118,119,124,143,144,146,147,148,149,150,165,166,168,169,170,171,172,173,174,175,184,191,192,196,198,],[-3,-59,-25,-26,-56,-57,-58,-60,-61,-64,-6,72,73,-4,-5,-7,-54,-8,-55,-9,-10,-11,-12,-13,-14,-18,-20,-24,-50,-51,-52,-53,-27,-29,-31,73,-17,-19,-23,-16,-22,-28,-30,-32,-33,-34,-15,-21,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,]),'EQ':([8,9,12,13,14,15,16,29,34,36,71,73,92,93,94,95,],[37,-59,-56,-57,-58,-60,-61,-64,37,37,-54,-55,-50,-51,-52,-53,]),'NE':([8,9,12,13,14,15,16,29,34,36,71,73,92,93,94,95,],[38,-59,-56,-57,-58,-60,-61,-64,38,38,-54,-55,-50,-51,-52,-53,]),'LT':([8,9,12,13,14,15,16,29,34,36,71,73,92,93,94,95,],[39,-59,-56,-57,-58,-60,-61,-64,39,39,-54,-55,-50,-51,-52,-53,]),'LE':([8,9,12,13,14,15,16,29,34,36,71,73,92,93,94,95,],[40,-59,-56,-57,-58,-60,-61,-64,40,40,-54,-55,-50,-51,-52,-53,]),'GT':([8,9,12,13,14,15,16,29,34,36,71,73,92,93,94,95,],[41,-59,-56,-57,-58,-60,-61,-64,41,41,-54,-55,-50,-51,-52,-53,]),'GE':([8,9,12,13,14,15,16,29,34,36,71,73,92,93,94,95,],[42,-59,-56,-57,-58,-60,-61,-64,42,42,-54,-55,-50,-51,-52,-53,]),'BETWEEN':([8,9,12,13,14,15,16,29,34,36,43,71,73,92,93,94,95,],[44,-59,-56,-57,-58,-60,-61,-64,44,44,82,-54,-55,-50,-51,-52,-53,]),'LIKE':([8,9,12,13,14,15,16,29,34,36,43,71,73,92,93,94,95,],[45,-59,-56,-57,-58,-60,-61,-64,45,45,83,-54,-55,-50,-51,-52,-53,]),'ILIKE':([8,9,12,13,14,15,16,29,34,36,43,71,73,92,93,94,95,],[46,-59,-56,-57,-58,-60,-61,-64,46,46,84,-54,-55,-50,-51,-52,-53,]),'IN':([8,9,12,13,14,15,16,29,34,36,43,71,73,92,93,94,95,],[47,-59,-56,-57,-58,-60,-61,-64,47,47,85,-54,-55,-50,-51,-52,-53,]),'IS':([8,9,12,13,14,15,16,29,34,36,71,73,92,93,94,95,],[48,-59,-56,-57,-58,-60,-61,-64,48,48,-54,-55,-50,-51,-52,-53,]),'PLUS':([8,9,12,13,14,15,16,29,34,36,71,73,74,77,78,79,80,81,86,92,93,94,95,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,122,143,151,152,153,154,155,156,157,158,159,160,161,165,167,],[49,-59,-56,-57,-58,-60,-61,-64,49,49,-54,-55,49,49,49,49,49,49,49,-50,-51,-52,-53,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,49,]),'MINUS':([8,9,12,13,14,15,16,29,34,36,71,73,74,77,78,79,80,81,86,92,93,94,95,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,122,143,151,152,153,154,155,156,157,158,159,160,161,165,167,],[50,-59,-56,-57,-58,-60,-61,-64,50,50,-54,-55,50,50,50,50,50,50,50,-50,-51,-52,-53,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,50,]),'TIMES':([8,9,12,13,14,15,16,29,34,36,71,73,74,77,78,79,80,81,86,92,93,94,95,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,122,143,151,152,153,154,155,156,157,158,159,160,161,165,167,],[51,-59,-56,-57,-58,-60,-61,-64,51,51,-54,-55,51,51,51,51,51,51,51,51,51,-52,-53,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,51,]),'DIVIDE':([8,9,12,13,14,15,16,29,34,36,71,73,74,77,78,79,80,81,86,92,93,94,95,100,101,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,122,143,151,152,153,154,155,156,157,158,159,160,161,165,167,],[52,-59,-56,-57,-58,-60,-61,-64,52,52,-54,-55,52,52,52,52,52,52,52,52,52,-52,-53,127,128,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,52,]),'BEFORE':([8,9,12,13,14,15,16,29,34,36,71,73,92,93,94,95,],[53,-59,-56,-57,-58,-60,-61,-64,53,53,-54,-55,-50,-51,-52,-53,]),'DURING':([8,9,12,13,14,15,16,29,34,36,71,73,92,93,94,95,97,],[54,-59,-56,-57,-58,-60,-61,-64,54,54,-54,-55,-50,-51,-52,-53,125,]),'AFTER':([8,9,12,13,14,15,16,29,34,36,71,73,92,93,94,95,99,],[55,-59,-56,-57,-58,-60,-61,-64,55,55,-54,-55,-50,-51,-52,-53,126,]),'COMMA':([9,12,13,14,15,16,29,71,73,92,93,94,95,103,104,105,106,107,108,109,110,111,112,113,114,122,123,142,159,160,161,162,163,164,167,181,182,183,190,194,],[-59,-56,-57,-58,-60,-61,-64,-54,-55,-50,-51,-52,-53,129,130,131,132,133,134,135,136,137,138,139,140,-49,145,145,176,177,178,179,-62,-63,-48,185,186,187,193,195,]),'NULL':([48,90,],[91,124,]),'TIME':([53,54,55,125,126,127,128,],[96,100,102,100,100,148,150,]),'DURATION':([54,125,126,127,],[101,101,101,149,]),'UNITS':([185,186,],[188,189,]),}
+_lr_action_items = {'NOT':([0,5,6,7,29,30,50,],[5,5,5,5,5,5,93,]),'LPAREN':([0,5,6,7,12,13,14,15,16,17,18,19,20,21,22,23,29,30,36,37,38,39,40,41,42,43,48,49,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,77,78,90,91,119,120,129,130,131,132,133,134,135,136,137,138,139,144,],[6,6,6,6,58,59,60,61,62,63,64,65,66,67,68,69,6,6,77,77,77,77,77,77,77,77,90,91,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,77,]),'LBRACKET':([0,5,6,7,29,30,36,37,38,39,40,41,42,43,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,77,78,90,91,119,120,129,130,131,132,133,134,135,136,137,138,139,144,],[7,7,7,7,7,7,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,78,]),'$end':([0,1,2,3,4,8,9,11,24,25,26,27,28,31,70,71,72,73,74,75,76,79,80,81,82,83,86,87,88,89,92,94,96,100,101,102,103,104,124,141,142,143,145,146,147,148,149,150,166,167,168,169,170,171,172,173,182,189,190,194,196,],[-64,0,-1,-2,-3,-9,-10,-53,-50,-51,-52,-54,-55,-6,-4,-5,-7,-60,-8,-61,-11,-12,-13,-14,-15,-16,-19,-20,-21,-22,-25,-27,-29,-31,-56,-57,-58,-59,-26,-17,-18,-23,-24,-28,-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,]),'INTERSECTS':([0,5,6,7,29,30,],[12,12,12,12,12,12,]),'DISJOINT':([0,5,6,7,29,30,],[13,13,13,13,13,13,]),'CONTAINS':([0,5,6,7,29,30,],[14,14,14,14,14,14,]),'WITHIN':([0,5,6,7,29,30,],[15,15,15,15,15,15,]),'TOUCHES':([0,5,6,7,29,30,],[16,16,16,16,16,16,]),'CROSSES':([0,5,6,7,29,30,],[17,17,17,17,17,17,]),'OVERLAPS':([0,5,6,7,29,30,],[18,18,18,18,18,18,]),'EQUALS':([0,5,6,7,29,30,],[19,19,19,19,19,19,]),'RELATE':([0,5,6,7,29,30,],[20,20,20,20,20,20,]),'DWITHIN':([0,5,6,7,29,30,],[21,21,21,21,21,21,]),'BEYOND':([0,5,6,7,29,30,],[22,22,22,22,22,22,]),'BBOX':([0,5,6,7,29,30,],[23,23,23,23,23,23,]),'ATTRIBUTE':([0,5,6,7,29,30,36,37,38,39,40,41,42,43,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,77,78,90,91,119,120,129,130,131,132,133,134,135,136,137,138,139,144,],[24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,24,]),'GEOMETRY':([0,5,6,7,29,30,36,37,38,39,40,41,42,43,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,77,78,90,91,119,120,129,130,131,132,133,134,135,136,137,138,139,144,],[25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,25,]),'ENVELOPE':([0,5,6,7,29,30,36,37,38,39,40,41,42,43,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,77,78,90,91,119,120,129,130,131,132,133,134,135,136,137,138,139,144,],[26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,26,]),'QUOTED':([0,5,6,7,29,30,36,37,38,39,40,41,42,43,44,45,46,47,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,77,78,90,91,119,120,129,130,131,132,133,134,135,136,137,138,139,144,174,193,],[11,11,11,11,11,11,11,11,11,11,11,11,11,11,86,87,88,89,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,11,178,195,]),'INTEGER':([0,5,6,7,29,30,36,37,38,39,40,41,42,43,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,77,78,90,91,119,120,129,130,131,132,133,134,135,136,137,138,139,140,144,175,176,177,185,191,],[27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,27,163,27,163,163,163,163,163,]),'FLOAT':([0,5,6,7,29,30,36,37,38,39,40,41,42,43,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,77,78,90,91,119,120,129,130,131,132,133,134,135,136,137,138,139,140,144,175,176,177,185,191,],[28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,28,164,28,164,164,164,164,164,]),'AND':([2,4,8,9,11,24,25,26,27,28,31,32,34,70,71,72,73,74,75,76,79,80,81,82,83,84,85,86,87,88,89,92,94,96,100,101,102,103,104,124,141,142,143,145,146,147,148,149,150,166,167,168,169,170,171,172,173,182,189,190,194,196,],[29,-3,-9,-10,-53,-50,-51,-52,-54,-55,29,29,29,29,29,-7,-60,-8,-61,-11,-12,-13,-14,-15,-16,119,120,-19,-20,-21,-22,-25,-27,-29,-31,-56,-57,-58,-59,-26,-17,-18,-23,-24,-28,-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,]),'OR':([2,4,8,9,11,24,25,26,27,28,31,32,34,51,52,70,71,72,73,74,75,76,79,80,81,82,83,86,87,88,89,92,94,96,100,101,102,103,104,124,141,142,143,145,146,147,148,149,150,166,167,168,169,170,171,172,173,182,189,190,194,196,],[30,-3,-9,-10,-53,-50,-51,-52,-54,-55,30,30,30,95,97,30,30,-7,-60,-8,-61,-11,-12,-13,-14,-15,-16,-19,-20,-21,-22,-25,-27,-29,-31,-56,-57,-58,-59,-26,-17,-18,-23,-24,-28,-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,]),'RPAREN':([4,8,9,11,24,25,26,27,28,31,32,33,70,71,72,73,74,75,76,79,80,81,82,83,86,87,88,89,92,94,96,100,101,102,103,104,117,121,122,123,124,141,142,143,145,146,147,148,149,150,151,152,153,154,155,156,157,158,163,164,165,166,167,168,169,170,171,172,173,178,182,186,187,189,190,192,194,195,196,],[-3,-9,-10,-53,-50,-51,-52,-54,-55,-6,72,73,-4,-5,-7,-60,-8,-61,-11,-12,-13,-14,-15,-16,-19,-20,-21,-22,-25,-27,-29,-31,-56,-57,-58,-59,73,-48,143,145,-26,-17,-18,-23,-24,-28,-30,-32,-33,-34,166,167,168,169,170,171,172,173,-62,-63,-49,-35,-36,-37,-38,-39,-40,-41,-42,182,-43,189,190,-44,-45,194,-46,196,-47,]),'RBRACKET':([4,8,9,11,24,25,26,27,28,31,34,35,70,71,72,73,74,75,76,79,80,81,82,83,86,87,88,89,92,94,96,100,101,102,103,104,118,124,141,142,143,145,146,147,148,149,150,166,167,168,169,170,171,172,173,182,189,190,194,196,],[-3,-9,-10,-53,-50,-51,-52,-54,-55,-6,74,75,-4,-5,-7,-60,-8,-61,-11,-12,-13,-14,-15,-16,-19,-20,-21,-22,-25,-27,-29,-31,-56,-57,-58,-59,75,-26,-17,-18,-23,-24,-28,-30,-32,-33,-34,-35,-36,-37,-38,-39,-40,-41,-42,-43,-44,-45,-46,-47,]),'EQ':([10,11,24,25,26,27,28,33,35,73,75,101,102,103,104,],[36,-53,-50,-51,-52,-54,-55,36,36,-60,-61,-56,-57,-58,-59,]),'NE':([10,11,24,25,26,27,28,33,35,73,75,101,102,103,104,],[37,-53,-50,-51,-52,-54,-55,37,37,-60,-61,-56,-57,-58,-59,]),'LT':([10,11,24,25,26,27,28,33,35,73,75,101,102,103,104,],[38,-53,-50,-51,-52,-54,-55,38,38,-60,-61,-56,-57,-58,-59,]),'LE':([10,11,24,25,26,27,28,33,35,73,75,101,102,103,104,],[39,-53,-50,-51,-52,-54,-55,39,39,-60,-61,-56,-57,-58,-59,]),'GT':([10,11,24,25,26,27,28,33,35,73,75,101,102,103,104,],[40,-53,-50,-51,-52,-54,-55,40,40,-60,-61,-56,-57,-58,-59,]),'GE':([10,11,24,25,26,27,28,33,35,73,75,101,102,103,104,],[41,-53,-50,-51,-52,-54,-55,41,41,-60,-61,-56,-57,-58,-59,]),'BETWEEN':([10,11,24,25,26,27,28,33,35,73,75,101,102,103,104,],[42,-53,-50,-51,-52,-54,-55,42,42,-60,-61,-56,-57,-58,-59,]),'NOT_BETWEEN':([10,11,24,25,26,27,28,33,35,73,75,101,102,103,104,],[43,-53,-50,-51,-52,-54,-55,43,43,-60,-61,-56,-57,-58,-59,]),'LIKE':([10,11,24,25,26,27,28,33,35,73,75,101,102,103,104,],[44,-53,-50,-51,-52,-54,-55,44,44,-60,-61,-56,-57,-58,-59,]),'ILIKE':([10,11,24,25,26,27,28,33,35,73,75,101,102,103,104,],[45,-53,-50,-51,-52,-54,-55,45,45,-60,-61,-56,-57,-58,-59,]),'NOT_LIKE':([10,11,24,25,26,27,28,33,35,73,75,101,102,103,104,],[46,-53,-50,-51,-52,-54,-55,46,46,-60,-61,-56,-57,-58,-59,]),'NOT_ILIKE':([10,11,24,25,26,27,28,33,35,73,75,101,102,103,104,],[47,-53,-50,-51,-52,-54,-55,47,47,-60,-61,-56,-57,-58,-59,]),'IN':([10,11,24,25,26,27,28,33,35,73,75,101,102,103,104,],[48,-53,-50,-51,-52,-54,-55,48,48,-60,-61,-56,-57,-58,-59,]),'NOT_IN':([10,11,24,25,26,27,28,33,35,73,75,101,102,103,104,],[49,-53,-50,-51,-52,-54,-55,49,49,-60,-61,-56,-57,-58,-59,]),'IS':([10,11,24,25,26,27,28,33,35,73,75,101,102,103,104,],[50,-53,-50,-51,-52,-54,-55,50,50,-60,-61,-56,-57,-58,-59,]),'BEFORE':([10,11,24,25,26,27,28,33,35,73,75,101,102,103,104,],[51,-53,-50,-51,-52,-54,-55,51,51,-60,-61,-56,-57,-58,-59,]),'DURING':([10,11,24,25,26,27,28,33,35,73,75,95,101,102,103,104,],[52,-53,-50,-51,-52,-54,-55,52,52,-60,-61,125,-56,-57,-58,-59,]),'AFTER':([10,11,24,25,26,27,28,33,35,73,75,97,101,102,103,104,],[53,-53,-50,-51,-52,-54,-55,53,53,-60,-61,126,-56,-57,-58,-59,]),'PLUS':([10,11,24,25,26,27,28,33,35,73,75,76,79,80,81,82,83,84,85,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,121,141,142,151,152,153,154,155,156,157,158,159,160,161,165,],[54,-53,-50,-51,-52,-54,-55,54,54,-60,-61,54,54,54,54,54,54,54,54,-56,-57,-58,-59,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,]),'MINUS':([10,11,24,25,26,27,28,33,35,73,75,76,79,80,81,82,83,84,85,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,121,141,142,151,152,153,154,155,156,157,158,159,160,161,165,],[55,-53,-50,-51,-52,-54,-55,55,55,-60,-61,55,55,55,55,55,55,55,55,-56,-57,-58,-59,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,]),'TIMES':([10,11,24,25,26,27,28,33,35,73,75,76,79,80,81,82,83,84,85,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,121,141,142,151,152,153,154,155,156,157,158,159,160,161,165,],[56,-53,-50,-51,-52,-54,-55,56,56,-60,-61,56,56,56,56,56,56,56,56,56,56,-58,-59,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'DIVIDE':([10,11,24,25,26,27,28,33,35,73,75,76,79,80,81,82,83,84,85,98,99,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,121,141,142,151,152,153,154,155,156,157,158,159,160,161,165,],[57,-53,-50,-51,-52,-54,-55,57,57,-60,-61,57,57,57,57,57,57,57,57,127,128,57,57,-58,-59,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,57,]),'COMMA':([11,24,25,26,27,28,73,75,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,121,122,123,159,160,161,162,163,164,165,179,180,181,188,192,],[-53,-50,-51,-52,-54,-55,-60,-61,-56,-57,-58,-59,129,130,131,132,133,134,135,136,137,138,139,140,-48,144,144,174,175,176,177,-62,-63,-49,183,184,185,191,193,]),'NULL':([50,93,],[92,124,]),'TIME':([51,52,53,125,126,127,128,],[94,98,100,98,98,148,150,]),'DURATION':([52,125,126,127,],[99,99,99,149,]),'UNITS':([183,184,],[186,187,]),}
 
 _lr_action = {}
 for _k, _v in _lr_action_items.items():
@@ -17,7 +17,7 @@ for _k, _v in _lr_action_items.items():
       _lr_action[_x][_k] = _y
 del _lr_action_items
 
-_lr_goto_items = {'condition_or_empty':([0,],[1,]),'condition':([0,5,6,7,30,31,],[2,32,33,35,68,69,]),'empty':([0,],[3,]),'predicate':([0,5,6,7,30,31,],[4,4,4,4,4,4,]),'expression':([0,5,6,7,30,31,37,38,39,40,41,42,44,49,50,51,52,56,57,58,59,60,61,62,63,64,65,66,67,75,76,82,89,120,121,129,130,131,132,133,134,135,136,137,138,139,141,145,],[8,8,34,36,8,8,74,77,78,79,80,81,86,92,93,94,95,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,122,122,143,151,152,153,154,155,156,157,158,159,160,161,165,167,]),'temporal_predicate':([0,5,6,7,30,31,],[10,10,10,10,10,10,]),'spatial_predicate':([0,5,6,7,30,31,],[11,11,11,11,11,11,]),'attribute':([0,5,6,7,30,31,37,38,39,40,41,42,44,49,50,51,52,56,57,58,59,60,61,62,63,64,65,66,67,75,76,82,89,120,121,129,130,131,132,133,134,135,136,137,138,139,141,145,],[14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,14,]),'time_period':([54,125,126,],[98,146,147,]),'expression_list':([89,120,],[123,142,]),'number':([140,177,178,179,187,193,],[162,181,182,183,190,194,]),}
+_lr_goto_items = {'condition_or_empty':([0,],[1,]),'condition':([0,5,6,7,29,30,],[2,31,32,34,70,71,]),'empty':([0,],[3,]),'predicate':([0,5,6,7,29,30,],[4,4,4,4,4,4,]),'temporal_predicate':([0,5,6,7,29,30,],[8,8,8,8,8,8,]),'spatial_predicate':([0,5,6,7,29,30,],[9,9,9,9,9,9,]),'expression':([0,5,6,7,29,30,36,37,38,39,40,41,42,43,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,77,78,90,91,119,120,129,130,131,132,133,134,135,136,137,138,139,144,],[10,10,33,35,10,10,76,79,80,81,82,83,84,85,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,121,121,141,142,151,152,153,154,155,156,157,158,159,160,161,165,]),'time_period':([52,125,126,],[96,146,147,]),'expression_list':([90,91,],[122,123,]),'number':([140,175,176,177,185,191,],[162,179,180,181,188,192,]),}
 
 _lr_goto = {}
 for _k, _v in _lr_goto_items.items():
@@ -27,69 +27,68 @@ for _k, _v in _lr_goto_items.items():
 del _lr_goto_items
 _lr_productions = [
   ("S' -> condition_or_empty","S'",1,None,None,None),
-  ('condition_or_empty -> condition','condition_or_empty',1,'p_condition_or_empty','parser.py',86),
-  ('condition_or_empty -> empty','condition_or_empty',1,'p_condition_or_empty','parser.py',87),
-  ('condition -> predicate','condition',1,'p_condition','parser.py',92),
-  ('condition -> condition AND condition','condition',3,'p_condition','parser.py',93),
-  ('condition -> condition OR condition','condition',3,'p_condition','parser.py',94),
-  ('condition -> NOT condition','condition',2,'p_condition','parser.py',95),
-  ('condition -> LPAREN condition RPAREN','condition',3,'p_condition','parser.py',96),
-  ('condition -> LBRACKET condition RBRACKET','condition',3,'p_condition','parser.py',97),
-  ('predicate -> expression EQ expression','predicate',3,'p_predicate','parser.py',110),
-  ('predicate -> expression NE expression','predicate',3,'p_predicate','parser.py',111),
-  ('predicate -> expression LT expression','predicate',3,'p_predicate','parser.py',112),
-  ('predicate -> expression LE expression','predicate',3,'p_predicate','parser.py',113),
-  ('predicate -> expression GT expression','predicate',3,'p_predicate','parser.py',114),
-  ('predicate -> expression GE expression','predicate',3,'p_predicate','parser.py',115),
-  ('predicate -> expression NOT BETWEEN expression AND expression','predicate',6,'p_predicate','parser.py',116),
-  ('predicate -> expression BETWEEN expression AND expression','predicate',5,'p_predicate','parser.py',117),
-  ('predicate -> expression NOT LIKE QUOTED','predicate',4,'p_predicate','parser.py',118),
-  ('predicate -> expression LIKE QUOTED','predicate',3,'p_predicate','parser.py',119),
-  ('predicate -> expression NOT ILIKE QUOTED','predicate',4,'p_predicate','parser.py',120),
-  ('predicate -> expression ILIKE QUOTED','predicate',3,'p_predicate','parser.py',121),
-  ('predicate -> expression NOT IN LPAREN expression_list RPAREN','predicate',6,'p_predicate','parser.py',122),
-  ('predicate -> expression IN LPAREN expression_list RPAREN','predicate',5,'p_predicate','parser.py',123),
-  ('predicate -> expression IS NOT NULL','predicate',4,'p_predicate','parser.py',124),
-  ('predicate -> expression IS NULL','predicate',3,'p_predicate','parser.py',125),
-  ('predicate -> temporal_predicate','predicate',1,'p_predicate','parser.py',126),
-  ('predicate -> spatial_predicate','predicate',1,'p_predicate','parser.py',127),
-  ('temporal_predicate -> expression BEFORE TIME','temporal_predicate',3,'p_temporal_predicate','parser.py',157),
-  ('temporal_predicate -> expression BEFORE OR DURING time_period','temporal_predicate',5,'p_temporal_predicate','parser.py',158),
-  ('temporal_predicate -> expression DURING time_period','temporal_predicate',3,'p_temporal_predicate','parser.py',159),
-  ('temporal_predicate -> expression DURING OR AFTER time_period','temporal_predicate',5,'p_temporal_predicate','parser.py',160),
-  ('temporal_predicate -> expression AFTER TIME','temporal_predicate',3,'p_temporal_predicate','parser.py',161),
-  ('time_period -> TIME DIVIDE TIME','time_period',3,'p_time_period','parser.py',172),
-  ('time_period -> TIME DIVIDE DURATION','time_period',3,'p_time_period','parser.py',173),
-  ('time_period -> DURATION DIVIDE TIME','time_period',3,'p_time_period','parser.py',174),
-  ('spatial_predicate -> INTERSECTS LPAREN expression COMMA expression RPAREN','spatial_predicate',6,'p_spatial_predicate','parser.py',179),
-  ('spatial_predicate -> DISJOINT LPAREN expression COMMA expression RPAREN','spatial_predicate',6,'p_spatial_predicate','parser.py',180),
-  ('spatial_predicate -> CONTAINS LPAREN expression COMMA expression RPAREN','spatial_predicate',6,'p_spatial_predicate','parser.py',181),
-  ('spatial_predicate -> WITHIN LPAREN expression COMMA expression RPAREN','spatial_predicate',6,'p_spatial_predicate','parser.py',182),
-  ('spatial_predicate -> TOUCHES LPAREN expression COMMA expression RPAREN','spatial_predicate',6,'p_spatial_predicate','parser.py',183),
-  ('spatial_predicate -> CROSSES LPAREN expression COMMA expression RPAREN','spatial_predicate',6,'p_spatial_predicate','parser.py',184),
-  ('spatial_predicate -> OVERLAPS LPAREN expression COMMA expression RPAREN','spatial_predicate',6,'p_spatial_predicate','parser.py',185),
-  ('spatial_predicate -> EQUALS LPAREN expression COMMA expression RPAREN','spatial_predicate',6,'p_spatial_predicate','parser.py',186),
-  ('spatial_predicate -> RELATE LPAREN expression COMMA expression COMMA QUOTED RPAREN','spatial_predicate',8,'p_spatial_predicate','parser.py',187),
-  ('spatial_predicate -> DWITHIN LPAREN expression COMMA expression COMMA number COMMA UNITS RPAREN','spatial_predicate',10,'p_spatial_predicate','parser.py',188),
-  ('spatial_predicate -> BEYOND LPAREN expression COMMA expression COMMA number COMMA UNITS RPAREN','spatial_predicate',10,'p_spatial_predicate','parser.py',189),
-  ('spatial_predicate -> BBOX LPAREN expression COMMA number COMMA number COMMA number COMMA number RPAREN','spatial_predicate',12,'p_spatial_predicate','parser.py',190),
-  ('spatial_predicate -> BBOX LPAREN expression COMMA number COMMA number COMMA number COMMA number COMMA QUOTED RPAREN','spatial_predicate',14,'p_spatial_predicate','parser.py',191),
-  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list','parser.py',210),
-  ('expression_list -> expression','expression_list',1,'p_expression_list','parser.py',211),
-  ('expression -> expression PLUS expression','expression',3,'p_expression','parser.py',220),
-  ('expression -> expression MINUS expression','expression',3,'p_expression','parser.py',221),
-  ('expression -> expression TIMES expression','expression',3,'p_expression','parser.py',222),
-  ('expression -> expression DIVIDE expression','expression',3,'p_expression','parser.py',223),
-  ('expression -> LPAREN expression RPAREN','expression',3,'p_expression','parser.py',224),
-  ('expression -> LBRACKET expression RBRACKET','expression',3,'p_expression','parser.py',225),
-  ('expression -> GEOMETRY','expression',1,'p_expression','parser.py',226),
-  ('expression -> ENVELOPE','expression',1,'p_expression','parser.py',227),
-  ('expression -> attribute','expression',1,'p_expression','parser.py',228),
-  ('expression -> QUOTED','expression',1,'p_expression','parser.py',229),
-  ('expression -> INTEGER','expression',1,'p_expression','parser.py',230),
-  ('expression -> FLOAT','expression',1,'p_expression','parser.py',231),
-  ('number -> INTEGER','number',1,'p_number','parser.py',248),
-  ('number -> FLOAT','number',1,'p_number','parser.py',249),
-  ('attribute -> ATTRIBUTE','attribute',1,'p_attribute','parser.py',254),
-  ('empty -> <empty>','empty',0,'p_empty','parser.py',259),
+  ('condition_or_empty -> condition','condition_or_empty',1,'p_condition_or_empty','parser.py',105),
+  ('condition_or_empty -> empty','condition_or_empty',1,'p_condition_or_empty','parser.py',106),
+  ('condition -> predicate','condition',1,'p_condition','parser.py',111),
+  ('condition -> condition AND condition','condition',3,'p_combination_condition','parser.py',116),
+  ('condition -> condition OR condition','condition',3,'p_combination_condition','parser.py',117),
+  ('condition -> NOT condition','condition',2,'p_not_condition','parser.py',122),
+  ('condition -> LPAREN condition RPAREN','condition',3,'p_grouped_condition','parser.py',127),
+  ('condition -> LBRACKET condition RBRACKET','condition',3,'p_grouped_condition','parser.py',128),
+  ('predicate -> temporal_predicate','predicate',1,'p_predicate','parser.py',133),
+  ('predicate -> spatial_predicate','predicate',1,'p_predicate','parser.py',134),
+  ('predicate -> expression EQ expression','predicate',3,'p_comparison_predicate','parser.py',139),
+  ('predicate -> expression NE expression','predicate',3,'p_comparison_predicate','parser.py',140),
+  ('predicate -> expression LT expression','predicate',3,'p_comparison_predicate','parser.py',141),
+  ('predicate -> expression LE expression','predicate',3,'p_comparison_predicate','parser.py',142),
+  ('predicate -> expression GT expression','predicate',3,'p_comparison_predicate','parser.py',143),
+  ('predicate -> expression GE expression','predicate',3,'p_comparison_predicate','parser.py',144),
+  ('predicate -> expression BETWEEN expression AND expression','predicate',5,'p_between_predicate','parser.py',149),
+  ('predicate -> expression NOT_BETWEEN expression AND expression','predicate',5,'p_not_between_predicate','parser.py',154),
+  ('predicate -> expression LIKE QUOTED','predicate',3,'p_like_predicate','parser.py',159),
+  ('predicate -> expression ILIKE QUOTED','predicate',3,'p_ilike_predicate','parser.py',164),
+  ('predicate -> expression NOT_LIKE QUOTED','predicate',3,'p_not_like_predicate','parser.py',169),
+  ('predicate -> expression NOT_ILIKE QUOTED','predicate',3,'p_not_ilike_predicate','parser.py',174),
+  ('predicate -> expression IN LPAREN expression_list RPAREN','predicate',5,'p_in_predicate','parser.py',179),
+  ('predicate -> expression NOT_IN LPAREN expression_list RPAREN','predicate',5,'p_not_in_predicate','parser.py',184),
+  ('predicate -> expression IS NULL','predicate',3,'p_null_predicate','parser.py',189),
+  ('predicate -> expression IS NOT NULL','predicate',4,'p_not_null_predicate','parser.py',194),
+  ('temporal_predicate -> expression BEFORE TIME','temporal_predicate',3,'p_before_predicate','parser.py',199),
+  ('temporal_predicate -> expression BEFORE OR DURING time_period','temporal_predicate',5,'p_before_or_during_predicate','parser.py',204),
+  ('temporal_predicate -> expression DURING time_period','temporal_predicate',3,'p_during_predicate','parser.py',209),
+  ('temporal_predicate -> expression DURING OR AFTER time_period','temporal_predicate',5,'p_during_or_after_predicate','parser.py',214),
+  ('temporal_predicate -> expression AFTER TIME','temporal_predicate',3,'p_after_predicate','parser.py',219),
+  ('time_period -> TIME DIVIDE TIME','time_period',3,'p_time_period','parser.py',224),
+  ('time_period -> TIME DIVIDE DURATION','time_period',3,'p_time_period','parser.py',225),
+  ('time_period -> DURATION DIVIDE TIME','time_period',3,'p_time_period','parser.py',226),
+  ('spatial_predicate -> INTERSECTS LPAREN expression COMMA expression RPAREN','spatial_predicate',6,'p_spatial_predicate','parser.py',231),
+  ('spatial_predicate -> DISJOINT LPAREN expression COMMA expression RPAREN','spatial_predicate',6,'p_spatial_predicate','parser.py',232),
+  ('spatial_predicate -> CONTAINS LPAREN expression COMMA expression RPAREN','spatial_predicate',6,'p_spatial_predicate','parser.py',233),
+  ('spatial_predicate -> WITHIN LPAREN expression COMMA expression RPAREN','spatial_predicate',6,'p_spatial_predicate','parser.py',234),
+  ('spatial_predicate -> TOUCHES LPAREN expression COMMA expression RPAREN','spatial_predicate',6,'p_spatial_predicate','parser.py',235),
+  ('spatial_predicate -> CROSSES LPAREN expression COMMA expression RPAREN','spatial_predicate',6,'p_spatial_predicate','parser.py',236),
+  ('spatial_predicate -> OVERLAPS LPAREN expression COMMA expression RPAREN','spatial_predicate',6,'p_spatial_predicate','parser.py',237),
+  ('spatial_predicate -> EQUALS LPAREN expression COMMA expression RPAREN','spatial_predicate',6,'p_spatial_predicate','parser.py',238),
+  ('spatial_predicate -> RELATE LPAREN expression COMMA expression COMMA QUOTED RPAREN','spatial_predicate',8,'p_relate_predicate','parser.py',243),
+  ('spatial_predicate -> DWITHIN LPAREN expression COMMA expression COMMA number COMMA UNITS RPAREN','spatial_predicate',10,'p_distance_predicate','parser.py',248),
+  ('spatial_predicate -> BEYOND LPAREN expression COMMA expression COMMA number COMMA UNITS RPAREN','spatial_predicate',10,'p_distance_predicate','parser.py',249),
+  ('spatial_predicate -> BBOX LPAREN expression COMMA number COMMA number COMMA number COMMA number RPAREN','spatial_predicate',12,'p_bbox_predicate','parser.py',256),
+  ('spatial_predicate -> BBOX LPAREN expression COMMA number COMMA number COMMA number COMMA number COMMA QUOTED RPAREN','spatial_predicate',14,'p_bbox_crs_predicate','parser.py',261),
+  ('expression_list -> expression','expression_list',1,'p_expression_list','parser.py',268),
+  ('expression_list -> expression_list COMMA expression','expression_list',3,'p_expression_list_append','parser.py',273),
+  ('expression -> ATTRIBUTE','expression',1,'p_expression','parser.py',281),
+  ('expression -> GEOMETRY','expression',1,'p_expression','parser.py',282),
+  ('expression -> ENVELOPE','expression',1,'p_expression','parser.py',283),
+  ('expression -> QUOTED','expression',1,'p_expression','parser.py',284),
+  ('expression -> INTEGER','expression',1,'p_expression','parser.py',285),
+  ('expression -> FLOAT','expression',1,'p_expression','parser.py',286),
+  ('expression -> expression PLUS expression','expression',3,'p_addition_expression','parser.py',292),
+  ('expression -> expression MINUS expression','expression',3,'p_subtraction_expression','parser.py',297),
+  ('expression -> expression TIMES expression','expression',3,'p_multiplication_expression','parser.py',302),
+  ('expression -> expression DIVIDE expression','expression',3,'p_division_expression','parser.py',307),
+  ('expression -> LPAREN expression RPAREN','expression',3,'p_grouped_expression','parser.py',312),
+  ('expression -> LBRACKET expression RBRACKET','expression',3,'p_grouped_expression','parser.py',313),
+  ('number -> INTEGER','number',1,'p_number','parser.py',318),
+  ('number -> FLOAT','number',1,'p_number','parser.py',319),
+  ('empty -> <empty>','empty',0,'p_empty','parser.py',324),
 ]
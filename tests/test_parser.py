@@ -25,8 +25,14 @@
 # THE SOFTWARE.
 # ------------------------------------------------------------------------------
 
+import copy
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
 from pycql import parse, get_repr
 from pycql.ast import *
+from pycql.values import Time, Duration
+from pycql.parser import _get_parser
 
 
 def test_attribute_eq_literal():
@@ -77,6 +83,55 @@ def test_attribute_ne_literal():
         '<>'
     )
 
+def test_grouped_conditions():
+    expected = CombinationConditionNode(
+        CombinationConditionNode(
+            ComparisonPredicateNode(
+                AttributeExpression('a'),
+                LiteralExpression(1),
+                '=',
+            ),
+            ComparisonPredicateNode(
+                AttributeExpression('b'),
+                LiteralExpression(2),
+                '=',
+            ),
+            'OR',
+        ),
+        ComparisonPredicateNode(
+            AttributeExpression('c'),
+            LiteralExpression(3),
+            '=',
+        ),
+        'AND',
+    )
+    assert parse('(a = 1 OR b = 2) AND c = 3') == expected
+    assert parse('[a = 1 OR b = 2] AND c = 3') == expected
+
+def test_ungrouped_conditions():
+    ast = parse('a = 1 OR b = 2 AND c = 3')
+    assert ast == CombinationConditionNode(
+        ComparisonPredicateNode(
+            AttributeExpression('a'),
+            LiteralExpression(1),
+            '=',
+        ),
+        CombinationConditionNode(
+            ComparisonPredicateNode(
+                AttributeExpression('b'),
+                LiteralExpression(2),
+                '=',
+            ),
+            ComparisonPredicateNode(
+                AttributeExpression('c'),
+                LiteralExpression(3),
+                '=',
+            ),
+            'AND',
+        ),
+        'OR',
+    )
+
 def test_attribute_between():
     ast = parse('attr BETWEEN 2 AND 5')
     assert ast == BetweenPredicateNode(
@@ -155,6 +210,15 @@ def test_attribute_not_in_list():
         True
     )
 
+def test_attribute_in_long_list():
+    values = ', '.join(str(i) for i in range(1000))
+    ast = parse('attr IN (%s)' % values)
+    assert ast == InPredicateNode(
+        AttributeExpression('attr'),
+        [LiteralExpression(i) for i in range(1000)],
+        False
+    )
+
 def test_attribute_is_null():
     ast = parse('attr IS NULL')
     assert ast == NullPredicateNode(
@@ -202,6 +266,25 @@ def test_attribute_is_not_null():
 #     )
 
 
+def test_attribute_before_or_during_time_period():
+    ast = parse(
+        'attr BEFORE OR DURING 2000-01-01T00:00:00Z / 2000-01-01T00:00:01Z'
+    )
+    assert ast == TemporalPredicateNode(
+        AttributeExpression('attr'),
+        (Time('2000-01-01T00:00:00Z'), Time('2000-01-01T00:00:01Z')),
+        'BEFORE OR DURING',
+    )
+
+def test_attribute_during_or_after_time_period():
+    ast = parse('attr DURING OR AFTER PT4S / 2000-01-01T00:00:03Z')
+    assert ast == TemporalPredicateNode(
+        AttributeExpression('attr'),
+        (Duration('PT4S'), Time('2000-01-01T00:00:03Z')),
+        'DURING OR AFTER',
+    )
+
+
 
 # Spatial predicate
 
@@ -232,10 +315,9 @@ def test_attribute_arithmetic_add():
     ast = parse('attr = 5 + 2')
     assert ast == ComparisonPredicateNode(
         AttributeExpression('attr'),
-        ArithmeticExpressionNode(
+        AdditionExpressionNode(
             LiteralExpression(5),
             LiteralExpression(2),
-            '+',
         ),
         '=',
     )
@@ -244,10 +326,9 @@ def test_attribute_arithmetic_sub():
     ast = parse('attr = 5 - 2')
     assert ast == ComparisonPredicateNode(
         AttributeExpression('attr'),
-        ArithmeticExpressionNode(
+        SubtractionExpressionNode(
             LiteralExpression(5),
             LiteralExpression(2),
-            '-',
         ),
         '=',
     )
@@ -256,10 +337,9 @@ def test_attribute_arithmetic_mul():
     ast = parse('attr = 5 * 2')
     assert ast == ComparisonPredicateNode(
         AttributeExpression('attr'),
-        ArithmeticExpressionNode(
+        MultiplicationExpressionNode(
             LiteralExpression(5),
             LiteralExpression(2),
-            '*',
         ),
         '=',
     )
@@ -268,10 +348,9 @@ def test_attribute_arithmetic_div():
     ast = parse('attr = 5 / 2')
     assert ast == ComparisonPredicateNode(
         AttributeExpression('attr'),
-        ArithmeticExpressionNode(
+        DivisionExpressionNode(
             LiteralExpression(5),
             LiteralExpression(2),
-            '/',
         ),
         '=',
     )
@@ -281,14 +360,12 @@ def test_attribute_arithmetic_add_mul():
     ast = parse('attr = 3 + 5 * 2')
     assert ast == ComparisonPredicateNode(
         AttributeExpression('attr'),
-        ArithmeticExpressionNode(
+        AdditionExpressionNode(
             LiteralExpression(3),
-            ArithmeticExpressionNode(
+            MultiplicationExpressionNode(
                 LiteralExpression(5),
                 LiteralExpression(2),
-                '*',
             ),
-            '+',
         ),
         '=',
     )
@@ -297,14 +374,12 @@ def test_attribute_arithmetic_div_sub():
     ast = parse('attr = 3 / 5 - 2')
     assert ast == ComparisonPredicateNode(
         AttributeExpression('attr'),
-        ArithmeticExpressionNode(
-            ArithmeticExpressionNode(
+        SubtractionExpressionNode(
+            DivisionExpressionNode(
                 LiteralExpression(3),
                 LiteralExpression(5),
-                '/',
             ),
             LiteralExpression(2),
-            '-',
         ),
         '=',
     )
@@ -313,14 +388,62 @@ def test_attribute_arithmetic_div_sub_bracketted():
     ast = parse('attr = 3 / (5 - 2)')
     assert ast == ComparisonPredicateNode(
         AttributeExpression('attr'),
-        ArithmeticExpressionNode(
+        DivisionExpressionNode(
             LiteralExpression(3),
-            ArithmeticExpressionNode(
+            SubtractionExpressionNode(
                 LiteralExpression(5),
                 LiteralExpression(2),
-                '-',
             ),
-            '/',
         ),
         '=',
     )
+
+def test_attribute_arithmetic_copy_pickle():
+    ast = parse('attr = 3 / (5 - 2) + 4 * 1')
+    assert copy.copy(ast) == ast
+    assert copy.deepcopy(ast) == ast
+    assert pickle.loads(pickle.dumps(ast)) == ast
+    assert pickle.loads(pickle.dumps(ast)).rhs.op == '+'
+
+def test_parse_concurrent():
+    queries = ['attr = %d' % i for i in range(100)]
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(parse, queries))
+
+    assert results == [
+        ComparisonPredicateNode(
+            AttributeExpression('attr'),
+            LiteralExpression(i),
+            '=',
+        )
+        for i in range(100)
+    ]
+
+def test_parse_custom_factories():
+    _get_parser.cache_clear()
+
+    for _ in range(3):
+        ast = parse('INTERSECTS(geometry, POINT(1 1))', geometry_factory=str)
+        assert ast == SpatialPredicateNode(
+            AttributeExpression('geometry'),
+            LiteralExpression('POINT(1 1)'),
+            'INTERSECTS',
+        )
+
+    assert _get_parser.cache_info().currsize == 1
+
+def test_parse_unhashable_factory():
+    class GeometryFactory:
+        __hash__ = None
+
+        def __call__(self, value):
+            return value
+
+    ast = parse(
+        'INTERSECTS(geometry, POINT(1 1))', geometry_factory=GeometryFactory()
+    )
+    assert ast == SpatialPredicateNode(
+        AttributeExpression('geometry'),
+        LiteralExpression('POINT(1 1)'),
+        'INTERSECTS',
+    )